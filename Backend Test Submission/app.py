@@ -1,14 +1,22 @@
 # app.py
-from flask import Flask, request, jsonify, redirect, url_for, abort
+from flask import Flask, Response, request, jsonify, redirect, url_for, abort
+from flask.json.provider import JSONProvider
+from werkzeug.wsgi import ClosingIterator
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import bindparam, event, insert, inspect, select, update
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.pool import QueuePool
 from datetime import datetime, timedelta, timezone
 import string
-import random
-import re
+import math
 import time
 import json
 import os
+import queue
+import threading
+import atexit
+import orjson
+from collections import OrderedDict
 
 # -------------------------
 # Configuration
@@ -20,9 +28,33 @@ HOSTNAME = "http://localhost:5000"  # change when deploying
 # -------------------------
 # Flask + DB setup
 # -------------------------
+class ORJSONProvider(JSONProvider):
+    """JSON provider backed by orjson; jsonify() builds the body as bytes."""
+    OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=self.OPTIONS).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, option=self.OPTIONS | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype="application/json")
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{DATABASE_FILE}"
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# keep SQLite connections open across requests instead of reopening the file
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    "poolclass": QueuePool,
+    "pool_size": 10,
+    "max_overflow": 20,
+    "pool_pre_ping": False,
+    "connect_args": {"check_same_thread": False, "timeout": 5},
+}
 db = SQLAlchemy(app)
 
 # -------------------------
@@ -35,10 +67,13 @@ class ShortURL(db.Model):
     original_url = db.Column(db.Text, nullable=False)
     created_at = db.Column(db.DateTime, nullable=False)
     expiry = db.Column(db.DateTime, nullable=False)
+    expiry_ts = db.Column(db.Integer, nullable=False, index=True)  # epoch seconds, for redirects
     # you can add 'created_by' or other fields if needed
 
 class Click(db.Model):
     __tablename__ = "clicks"
+    # serves the per-shortcode stats lookup already in timestamp order
+    __table_args__ = (db.Index("ix_clicks_shortcode_ts", "shortcode", "timestamp"),)
     id = db.Column(db.Integer, primary_key=True)
     shortcode = db.Column(db.String(64), db.ForeignKey('shorturls.shortcode'), nullable=False)
     timestamp = db.Column(db.DateTime, nullable=False)
@@ -47,11 +82,90 @@ class Click(db.Model):
     ip = db.Column(db.String(64), nullable=True)
     user_agent = db.Column(db.Text, nullable=True)
 
+# -------------------------
+# SQLite tuning
+# -------------------------
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",        # readers don't block on the writer
+    "PRAGMA synchronous=NORMAL",      # safe with WAL, avoids fsync per commit
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",       # ~20 MB page cache
+    "PRAGMA mmap_size=268435456",     # 256 MB
+    "PRAGMA busy_timeout=5000",       # ms
+    "PRAGMA wal_autocheckpoint=1000", # pages
+)
+
+def _set_sqlite_pragmas(dbapi_conn, connection_record):
+    cursor = dbapi_conn.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+def expiry_epoch(dt: datetime):
+    # epoch seconds rounded up, so a link never expires before the
+    # expiry the API reports; naive values are UTC
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return math.ceil(dt.timestamp())
+
 # -------------------------
 # Ensure DB exists
 # -------------------------
 with app.app_context():
-    db.create_all()
+    # WAL needs a real file; an in-memory DB keeps the defaults
+    if db.engine.url.database not in (None, "", ":memory:"):
+        event.listen(db.engine, "connect", _set_sqlite_pragmas)
+
+def init_db():
+    """Create tables, run pending migrations and build missing indexes."""
+    with app.app_context(), db.engine.connect() as conn:
+        # BEGIN IMMEDIATE takes the write lock before any existence check,
+        # so processes starting together serialize here instead of racing
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+        db.metadata.create_all(conn)
+        # databases created before expiry_ts existed: add and backfill it
+        if "expiry_ts" not in {c["name"] for c in inspect(conn).get_columns("shorturls")}:
+            table = ShortURL.__table__
+            conn.exec_driver_sql("ALTER TABLE shorturls ADD COLUMN expiry_ts INTEGER NOT NULL DEFAULT 0")
+            rows = conn.execute(select(table.c.id, table.c.expiry)).all()
+            if rows:
+                conn.execute(
+                    update(table).where(table.c.id == bindparam("row_id"))
+                    .values(expiry_ts=bindparam("ts")),
+                    [{"row_id": row_id, "ts": expiry_epoch(expiry)} for row_id, expiry in rows],
+                )
+        # create_all() skips indexes on tables that already exist
+        for index in (*ShortURL.__table__.indexes, *Click.__table__.indexes):
+            index.create(conn, checkfirst=True)
+        conn.commit()
+
+# under gunicorn this import happens once, in the master (preload_app)
+init_db()
+
+# -------------------------
+# Prepared statements
+# -------------------------
+# Built once and bound per request, so SQLAlchemy's compiled-statement
+# cache is hit every time instead of constructing a Query on each call.
+_shorturls = ShortURL.__table__
+_clicks = Click.__table__
+
+LOOKUP_STMT = (
+    select(_shorturls.c.original_url, _shorturls.c.expiry_ts)
+    .where(_shorturls.c.shortcode == bindparam("sc"))
+)
+STATS_URL_STMT = (
+    select(_shorturls.c.original_url, _shorturls.c.created_at, _shorturls.c.expiry)
+    .where(_shorturls.c.shortcode == bindparam("sc"))
+)
+STATS_CLICKS_STMT = (
+    select(_clicks.c.timestamp, _clicks.c.referrer, _clicks.c.location, _clicks.c.ip, _clicks.c.user_agent)
+    .where(_clicks.c.shortcode == bindparam("sc"))
+    .order_by(_clicks.c.timestamp.asc())
+    .execution_options(yield_per=1000)
+)
 
 # -------------------------
 # Logging Middleware (custom)
@@ -62,58 +176,274 @@ class RequestLoggerMiddleware:
     NOTE: This purposely avoids using Python's logging module so it
     is clear and self-contained. If you have a pre-test middleware,
     replace this with your provided middleware.
+
+    Entries are handed to a background thread through a bounded queue,
+    so the response path never touches the file. The writer batches
+    entries and appends each batch with a single write(); if the queue
+    is full the entry is dropped and counted in `dropped`.
     """
+    QUEUE_SIZE = 10000
+    FLUSH_INTERVAL = 0.05      # seconds
+    FLUSH_BYTES = 64 * 1024
+    _STOP = object()
+
     def __init__(self, app, logfile=LOG_FILE):
         self.app = app
         self.logfile = logfile
-        # attach hooks
-        @app.before_request
-        def _start_timer():
-            request._start_time = time.time()
-
-        @app.after_request
-        def _log_response(response):
+        self.dropped = 0
+        self._fd = os.open(logfile, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self.start()
+        atexit.register(self.close)
+        # wrap at the WSGI layer: timing lives in locals, not on the request proxy
+        self.wsgi_app = app.wsgi_app
+        app.wsgi_app = self
+
+    def start(self):
+        # fresh queue and writer; called again in forked workers, which do
+        # not inherit the parent's thread
+        self._queue = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self._writer = threading.Thread(target=self._writer_loop, name="access-log-writer", daemon=True)
+        self._writer.start()
+
+    def __call__(self, environ, start_response):
+        start_ns = time.monotonic_ns()
+        status = []
+
+        def _start_response(status_line, headers, exc_info=None):
+            status.append(status_line)
+            return start_response(status_line, headers, exc_info)
+
+        body = self.wsgi_app(environ, _start_response)
+        return ClosingIterator(body, lambda: self._log_response(environ, status, start_ns))
+
+    def _log_response(self, environ, status, start_ns):
+        try:
+            duration = (time.monotonic_ns() - start_ns) / 1e6
+            path = environ.get("PATH_INFO", "").encode("latin-1").decode("utf-8", "replace")
+            entry = {
+                "timestamp": datetime.utcnow().replace(tzinfo=timezone.utc).isoformat(),
+                "method": environ.get("REQUEST_METHOD"),
+                "path": "/" + path.lstrip("/"),
+                "query_string": environ.get("QUERY_STRING", ""),
+                "status": int(status[-1][:3]) if status else None,
+                "duration_ms": round(duration, 2),
+                "client_ip": environ.get("HTTP_X_FORWARDED_FOR") or environ.get("REMOTE_ADDR"),
+                "user_agent": environ.get("HTTP_USER_AGENT"),
+            }
             try:
-                duration = (time.time() - getattr(request, "_start_time", time.time())) * 1000.0
-                entry = {
-                    "timestamp": datetime.utcnow().replace(tzinfo=timezone.utc).isoformat(),
-                    "method": request.method,
-                    "path": request.path,
-                    "query_string": request.query_string.decode() if request.query_string else "",
-                    "status": response.status_code,
-                    "duration_ms": round(duration, 2),
-                    "client_ip": request.headers.get("X-Forwarded-For", request.remote_addr),
-                    "user_agent": request.headers.get("User-Agent"),
-                }
-                # write JSON line
-                with open(self.logfile, "a", encoding="utf-8") as f:
-                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                self._queue.put_nowait(entry)
+            except queue.Full:
+                self.dropped += 1
+        except Exception:
+            # never raise from logger
+            pass
+
+    @staticmethod
+    def _format(entry):
+        return json.dumps(entry, ensure_ascii=False) + "\n"
+
+    def _write(self, lines):
+        os.write(self._fd, "".join(lines).encode("utf-8"))
+
+    def _writer_loop(self):
+        stopping = False
+        while not stopping:
+            entry = self._queue.get()
+            if entry is self._STOP:
+                break
+            line = self._format(entry)
+            lines = [line]
+            size = len(line)
+            deadline = time.monotonic() + self.FLUSH_INTERVAL
+            while size < self.FLUSH_BYTES:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    entry = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if entry is self._STOP:
+                    stopping = True
+                    break
+                line = self._format(entry)
+                lines.append(line)
+                size += len(line)
+            try:
+                self._write(lines)
             except Exception:
                 # never raise from logger
                 pass
-            return response
+
+    def close(self):
+        # let the writer drain what is queued, then release the descriptor;
+        # the fd is only closed once no write can still be in flight
+        try:
+            self._queue.put(self._STOP, timeout=1)
+        except queue.Full:
+            return
+        self._writer.join(timeout=1)
+        if not self._writer.is_alive():
+            os.close(self._fd)
 
 # attach middleware
-RequestLoggerMiddleware(app)
+request_logger = RequestLoggerMiddleware(app)
+
+# -------------------------
+# Click recorder (background)
+# -------------------------
+class ClickRecorder:
+    """
+    Records clicks off the redirect path. Rows are queued and a daemon
+    thread inserts them in batches with a single executemany per commit.
+    If the queue is full the click is dropped and counted in `dropped`.
+    """
+    QUEUE_SIZE = 10000
+    FLUSH_INTERVAL = 0.02      # seconds
+    BATCH_SIZE = 500
+    _STOP = object()
+
+    def __init__(self, app):
+        with app.app_context():
+            self.engine = db.engine
+        self.dropped = 0
+        self.start()
+        atexit.register(self.close)
+
+    def start(self):
+        # fresh queue and worker; called again in forked workers, which do
+        # not inherit the parent's thread
+        self._queue = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self._worker = threading.Thread(target=self._worker_loop, name="click-recorder", daemon=True)
+        self._worker.start()
+
+    def record(self, **row):
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            self.dropped += 1
+
+    def _insert(self, rows):
+        with self.engine.begin() as conn:
+            conn.execute(insert(Click), rows)
+
+    def _worker_loop(self):
+        stopping = False
+        while not stopping:
+            row = self._queue.get()
+            if row is self._STOP:
+                break
+            rows = [row]
+            deadline = time.monotonic() + self.FLUSH_INTERVAL
+            while len(rows) < self.BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    row = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if row is self._STOP:
+                    stopping = True
+                    break
+                rows.append(row)
+            try:
+                self._insert(rows)
+            except Exception:
+                # clicks are best-effort; never kill the worker
+                pass
+
+    def close(self):
+        # let the worker drain what is queued and finish its last insert
+        try:
+            self._queue.put(self._STOP, timeout=1)
+        except queue.Full:
+            return
+        self._worker.join(timeout=1)
+
+click_recorder = ClickRecorder(app)
+
+def after_fork():
+    """Reset per-process state in a forked worker (gunicorn post_fork)."""
+    with app.app_context():
+        # don't reuse SQLite connections the master opened in init_db()
+        db.engine.dispose(close=False)
+    request_logger.start()
+    click_recorder.start()
 
 # -------------------------
 # Helpers
 # -------------------------
 ALPHABET = string.ascii_letters + string.digits
-SHORTCODE_RE = re.compile(r'^[A-Za-z0-9]{4,64}$')  # allowed chars and reasonable length
+SHORTCODE_MIN_LEN, SHORTCODE_MAX_LEN = 4, 64  # reasonable length
+
+# byte -> alphabet character; bytes >= 248 (62 * 4) are dropped so every
+# character is equally likely
+_SHORTCODE_TABLE = bytes(ord(ALPHABET[b % len(ALPHABET)]) for b in range(256))
+_SHORTCODE_REJECT = bytes(range(len(ALPHABET) * 4, 256))
+_urandom = os.urandom
 
 def generate_shortcode(length=6):
-    """Generate a random alphanumeric shortcode."""
-    return ''.join(random.choices(ALPHABET, k=length))
+    """Generate a random alphanumeric shortcode from os.urandom."""
+    # one call is almost always enough; loop only if too many bytes were rejected
+    code = _urandom(length + 2).translate(_SHORTCODE_TABLE, _SHORTCODE_REJECT)
+    while len(code) < length:
+        code += _urandom(length + 2).translate(_SHORTCODE_TABLE, _SHORTCODE_REJECT)
+    return code[:length].decode("ascii")
+
+def valid_shortcode(code: str):
+    # ASCII letters/digits only; isascii() + isalnum() is cheaper than a regex
+    return SHORTCODE_MIN_LEN <= len(code) <= SHORTCODE_MAX_LEN and code.isascii() and code.isalnum()
 
 def now_utc():
     return datetime.utcnow().replace(tzinfo=timezone.utc)
 
 def to_iso_z(dt: datetime):
-    # returns ISO 8601 with trailing Z (UTC)
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
-    return dt.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+    # returns ISO 8601 with trailing Z (UTC); naive values are already UTC.
+    # Runs once per click row, so the common naive case skips tz conversion.
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt.isoformat() + "Z"
+
+class LRUCache:
+    """Small thread-safe LRU mapping used for hot lookups."""
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+def error_body(message):
+    # same bytes jsonify would produce, computed once at import time
+    return (json.dumps({"error": message}, separators=(",", ":")) + "\n").encode("utf-8")
+
+def json_response(body, status):
+    # fresh Response per request (hooks may mutate it), but no serialization
+    return Response(body, status=status, mimetype="application/json")
+
+SHORTCODE_NOT_FOUND_BODY = error_body("Shortcode not found")
+SHORTLINK_EXPIRED_BODY = error_body("Shortlink expired")
+BAD_REQUEST_BODY = error_body("Bad request")
+NOT_FOUND_BODY = error_body("Not found")
+METHOD_NOT_ALLOWED_BODY = error_body("Method not allowed")
+INTERNAL_ERROR_BODY = error_body("Internal server error")
+
+# shortcode -> (original_url, expiry_epoch); rows are write-once, so
+# entries never need invalidating. Misses are not cached.
+shortcode_cache = LRUCache(maxsize=10000)
 
 def validate_url(url: str):
     # Basic validation: must start with http:// or https:// and have at least one dot.
@@ -155,45 +485,37 @@ def create_shorturl():
     custom_shortcode = data.get("shortcode")
     if custom_shortcode:
         custom_shortcode = str(custom_shortcode).strip()
-        if not SHORTCODE_RE.match(custom_shortcode):
+        if not valid_shortcode(custom_shortcode):
             return jsonify({"error": "Provided 'shortcode' invalid. Must be alphanumeric and length 4-64."}), 400
-        # check uniqueness
-        existing = ShortURL.query.filter_by(shortcode=custom_shortcode).first()
-        if existing:
-            return jsonify({"error": "Shortcode already in use"}), 409
-        shortcode = custom_shortcode
-    else:
-        # generate unique shortcode (retry loop)
-        shortcode = None
-        for attempt_len in (6, 7, 8):  # try increasing lengths if collisions
-            for _ in range(6):  # a few attempts per length
-                candidate = generate_shortcode(length=attempt_len)
-                if not ShortURL.query.filter_by(shortcode=candidate).first():
-                    shortcode = candidate
-                    break
-            if shortcode:
-                break
-        if not shortcode:
-            # final attempt with random long candidate
-            candidate = generate_shortcode(length=10)
-            if ShortURL.query.filter_by(shortcode=candidate).first():
-                return jsonify({"error": "Could not generate a unique shortcode. Try again."}), 500
-            shortcode = candidate
 
     created_at = datetime.utcnow().replace(tzinfo=timezone.utc)
     expiry = created_at + timedelta(minutes=validity)
 
-    short = ShortURL(shortcode=shortcode, original_url=original_url,
-                     created_at=created_at, expiry=expiry)
-    db.session.add(short)
-    try:
-        db.session.commit()
-    except IntegrityError:
-        db.session.rollback()
-        return jsonify({"error": "Shortcode collision occurred (try a different custom shortcode)"}), 409
-    except Exception as e:
-        db.session.rollback()
-        return jsonify({"error": "Internal server error creating shortcode"}), 500
+    # rely on the UNIQUE constraint instead of probing with SELECTs:
+    # insert directly and retry with a fresh candidate on collision
+    attempts = 1 if custom_shortcode else 8
+    for attempt in range(attempts):
+        if custom_shortcode:
+            shortcode = custom_shortcode
+        else:
+            shortcode = generate_shortcode(length=6 if attempt < 4 else 8)
+        try:
+            # Core insert: no ORM instance or unit-of-work flush for one row
+            db.session.execute(insert(ShortURL).values(
+                shortcode=shortcode, original_url=original_url,
+                created_at=created_at, expiry=expiry,
+                expiry_ts=expiry_epoch(expiry)))
+            db.session.commit()
+            break
+        except IntegrityError:
+            db.session.rollback()
+            if custom_shortcode:
+                return jsonify({"error": "Shortcode already in use"}), 409
+        except Exception as e:
+            db.session.rollback()
+            return jsonify({"error": "Internal server error creating shortcode"}), 500
+    else:
+        return jsonify({"error": "Could not generate a unique shortcode. Try again."}), 500
 
     short_link = f"{HOSTNAME.rstrip('/')}/{shortcode}"
     return jsonify({
@@ -206,20 +528,22 @@ def create_shorturl():
 # -------------------------
 @app.route("/shorturls/<string:shortcode>", methods=["GET"])
 def get_shorturl_stats(shortcode):
-    s = ShortURL.query.filter_by(shortcode=shortcode).first()
+    s = db.session.execute(STATS_URL_STMT, {"sc": shortcode}).first()
     if not s:
         return jsonify({"error": "Shortcode not found"}), 404
 
-    clicks_q = Click.query.filter_by(shortcode=shortcode).order_by(Click.timestamp.asc()).all()
-    click_list = []
-    for c in clicks_q:
-        click_list.append({
-            "timestamp": to_iso_z(c.timestamp),
-            "referrer": c.referrer,
-            "location": c.location or "unknown",
-            "ip": c.ip,
-            "user_agent": c.user_agent
-        })
+    # plain row tuples, no ORM instances for potentially many clicks
+    clicks_q = db.session.execute(STATS_CLICKS_STMT, {"sc": shortcode})
+    click_list = [
+        {
+            "timestamp": to_iso_z(ts),
+            "referrer": referrer,
+            "location": location or "unknown",
+            "ip": ip,
+            "user_agent": user_agent
+        }
+        for ts, referrer, location, ip, user_agent in clicks_q
+    ]
 
     response = {
         "clicks": len(click_list),
@@ -235,66 +559,67 @@ def get_shorturl_stats(shortcode):
 # -------------------------
 @app.route("/<string:shortcode>", methods=["GET"])
 def redirect_to_original(shortcode):
-    s = ShortURL.query.filter_by(shortcode=shortcode).first()
-    if not s:
-        # Not found
-        return jsonify({"error": "Shortcode not found"}), 404
-
-    now = datetime.utcnow().replace(tzinfo=timezone.utc)
-    if now > s.expiry:
-        return jsonify({"error": "Shortlink expired"}), 410
+    target = shortcode_cache.get(shortcode)
+    if target is None:
+        row = db.session.execute(LOOKUP_STMT, {"sc": shortcode}).first()
+        if not row:
+            # Not found
+            return json_response(SHORTCODE_NOT_FOUND_BODY, 404)
+        target = (row.original_url, row.expiry_ts)
+        shortcode_cache.put(shortcode, target)
+    original_url, expiry_ts = target
+
+    # plain number compare, no datetime construction per redirect
+    if time.time() > expiry_ts:
+        return json_response(SHORTLINK_EXPIRED_BODY, 410)
 
     # Track click
-    referrer = request.headers.get("Referer") or request.headers.get("Referrer")
-    ip = request.headers.get("X-Forwarded-For", request.remote_addr)
-    user_agent = request.headers.get("User-Agent")
+    # read the WSGI environ directly; one dict lookup per header
+    environ = request.environ
+    referrer = environ.get("HTTP_REFERER") or environ.get("HTTP_REFERRER")
+    ip = environ.get("HTTP_X_FORWARDED_FOR") or environ.get("REMOTE_ADDR")
+    user_agent = environ.get("HTTP_USER_AGENT")
     # coarse-grained location - placeholder 'unknown'
     location = "unknown"
 
-    click = Click(
+    # queued; inserted in batches by the background recorder
+    click_recorder.record(
         shortcode=shortcode,
-        timestamp=now,
+        timestamp=now_utc(),
         referrer=referrer,
         location=location,
         ip=ip,
         user_agent=user_agent
     )
-    db.session.add(click)
-    try:
-        db.session.commit()
-    except Exception:
-        db.session.rollback()
-        # do not block redirect on DB error
-        pass
 
     # HTTP redirect to original URL
-    return redirect(s.original_url, code=302)
+    return redirect(original_url, code=302)
 
 # -------------------------
 # Error handlers for JSON responses
 # -------------------------
 @app.errorhandler(400)
 def bad_request(e):
-    return jsonify({"error": "Bad request"}), 400
+    return json_response(BAD_REQUEST_BODY, 400)
 
 @app.errorhandler(404)
 def not_found(e):
-    return jsonify({"error": "Not found"}), 404
+    return json_response(NOT_FOUND_BODY, 404)
 
 @app.errorhandler(405)
 def method_not_allowed(e):
-    return jsonify({"error": "Method not allowed"}), 405
+    return json_response(METHOD_NOT_ALLOWED_BODY, 405)
 
 @app.errorhandler(500)
 def internal_error(e):
-    return jsonify({"error": "Internal server error"}), 500
+    return json_response(INTERNAL_ERROR_BODY, 500)
 
 # -------------------------
 # Run (for local dev)
 # -------------------------
+# In production serve with gunicorn instead (see gunicorn.conf.py):
+#   gunicorn app:app
+# which is equivalent to
+#   gunicorn -w 4 -k gthread --threads 8 -b 0.0.0.0:5000 app:app
 if __name__ == "__main__":
-    # ensure log file exists
-    if not os.path.exists(LOG_FILE):
-        open(LOG_FILE, "a").close()
-    app.run(host="0.0.0.0", port=5000, debug=False)
-
+    app.run(host="0.0.0.0", port=5000, debug=False, threaded=True)
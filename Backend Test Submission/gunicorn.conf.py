@@ -0,0 +1,16 @@
+# gunicorn.conf.py
+# Production entry point:  gunicorn app:app
+# (gunicorn reads this file from the working directory)
+bind = "0.0.0.0:5000"
+workers = 4
+worker_class = "gthread"   # threads share each worker's pooled SQLite connections
+threads = 8
+# import the app once in the master, so the schema setup in init_db() runs
+# a single time; post_fork then gives each worker its own DB connections
+# and access-log / click-recorder threads
+preload_app = True
+
+
+def post_fork(server, worker):
+    import app
+    app.after_fork()